@@ -5,6 +5,7 @@ High-performance client for AiMesh AI agent message queue.
 """
 
 from .client import AiMeshClient
+from .async_client import AsyncAiMeshClient
 from .models import (
     Message,
     RoutingDecision,
@@ -23,6 +24,7 @@ from .exceptions import (
 __version__ = "0.1.0"
 __all__ = [
     "AiMeshClient",
+    "AsyncAiMeshClient",
     "Message",
     "RoutingDecision",
     "Acknowledgment",
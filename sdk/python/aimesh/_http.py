@@ -0,0 +1,171 @@
+"""
+AiMesh SDK request helpers
+
+Retry policy, error mapping and request-body builders shared by the
+sync and async clients.
+"""
+
+import base64
+import os
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+from urllib.parse import urlsplit
+
+from . import _json
+from .models import EndpointMetrics, _new_id
+from .exceptions import (
+    AiMeshError,
+    RateLimitError,
+    BudgetExceededError,
+    ValidationError,
+)
+
+
+# Statuses retried with backoff: rate limiting and transient server errors.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _rate_limit_retry_after(headers: Any) -> int:
+    """Seconds to wait after a 429, defaulting to 60 without a Retry-After."""
+    retry_after = parse_retry_after(headers.get("Retry-After"))
+    return 60 if retry_after is None else int(retry_after)
+
+
+def backoff_delay(
+    attempt: int,
+    base: float,
+    cap: float,
+    retry_after: Optional[float] = None,
+) -> float:
+    """
+    Delay before retry number ``attempt`` (0-based).
+
+    Full jitter: uniform over [0, min(cap, base * 2**attempt)], but never
+    shorter than the server's Retry-After.
+    """
+    delay = random.uniform(0, min(cap, base * 2 ** attempt))
+    return max(delay, retry_after or 0.0)
+
+
+def retry_delay(
+    status: int,
+    headers: Any,
+    attempt: int,
+    max_retries: int,
+    base: float,
+    cap: float,
+) -> Optional[float]:
+    """
+    Seconds to wait before retrying a response, or None to give up.
+
+    Only ``RETRY_STATUSES`` are retried, at most ``max_retries`` times. A
+    Retry-After longer than ``cap`` is not waited out; the response is
+    surfaced to the caller instead.
+    """
+    if status not in RETRY_STATUSES or attempt >= max_retries:
+        return None
+    retry_after = parse_retry_after(headers.get("Retry-After"))
+    if retry_after is not None and retry_after > cap:
+        return None
+    return backoff_delay(attempt, base, cap, retry_after)
+
+
+_LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
+
+def local_uds_path(base_url: str, uds_path: Optional[str]) -> Optional[str]:
+    """
+    Unix socket to use for ``base_url``, if any.
+
+    Falls back to the ``AIMESH_UDS_PATH`` environment variable, and only
+    applies to loopback URLs so remote servers are never redirected.
+    """
+    uds_path = uds_path or os.environ.get("AIMESH_UDS_PATH")
+    if uds_path and urlsplit(base_url).hostname in _LOCAL_HOSTS:
+        return uds_path
+    return None
+
+
+decode_endpoints = _json.list_decoder(EndpointMetrics, "endpoints")
+
+
+def raw_messages(
+    agent_id: str,
+    payloads: Iterable[bytes],
+    priority: int,
+    budget: float,
+) -> List[dict]:
+    """
+    Build wire-format message dicts for ``payloads`` without ``Message``.
+
+    The clock is read once for the whole batch, so every message shares
+    the same timestamp and deadline. The remaining fields carry the same
+    defaults a ``Message`` would send.
+    """
+    now_ns = time.time_ns()
+    deadline = now_ns // 1_000_000 + 60000
+    b64encode = base64.b64encode
+    return [
+        {
+            "agent_id": agent_id,
+            "message_id": _new_id(),
+            "payload": b64encode(payload).decode("ascii"),
+            "payload_encoding": "base64",
+            "estimated_cost_tokens": 0.0,
+            "budget_tokens": budget,
+            "deadline_ms": deadline,
+            "task_graph_id": "",
+            "dependencies": [],
+            "priority": priority,
+            "dedup_context": "",
+            "trace_id": "",
+            "metadata": {},
+            "timestamp": now_ns,
+        }
+        for payload in payloads
+    ]
+
+
+# HTTP status -> exception factory. Each factory takes the response
+# headers and raw body and decodes the body only if it uses it.
+_HTTP_ERRORS: Dict[int, Callable[[Any, Union[bytes, bytearray]], AiMeshError]] = {
+    429: lambda headers, body: RateLimitError(
+        f"Rate limit exceeded: {body.decode(errors='replace')}",
+        _rate_limit_retry_after(headers),
+    ),
+    # Budget exceeded
+    402: lambda headers, body: BudgetExceededError("unknown", 0, 0),
+    400: lambda headers, body: ValidationError("request", body.decode(errors="replace")),
+}
+
+
+def error_from_response(
+    status: int, headers: Any, body: Union[bytes, bytearray]
+) -> AiMeshError:
+    """Map an HTTP error response to the matching SDK exception."""
+    if 300 <= status < 400:
+        # Redirects are not followed; a moved server needs a new base_url.
+        return AiMeshError(
+            f"HTTP {status}: redirect to {headers.get('Location')} not followed"
+        )
+    factory = _HTTP_ERRORS.get(status)
+    if factory is None:
+        return AiMeshError(f"HTTP {status}: {body.decode(errors='replace')}")
+    return factory(headers, body)
@@ -0,0 +1,143 @@
+"""
+AiMesh SDK JSON codec
+
+Uses orjson when it is installed and falls back to the standard library.
+Model dataclasses are serialized directly, without building an
+intermediate dict; ``bytes`` values are emitted as base64 strings and
+numpy arrays as nested JSON arrays.
+"""
+
+import base64
+import dataclasses
+import json
+from typing import Any, Callable, Dict, List, Union, get_type_hints
+
+from .exceptions import ValidationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without the extra
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised without the extra
+    msgspec = None  # type: ignore[assignment]
+
+
+def _default(obj):
+    """Serialize types the JSON backend does not handle natively."""
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return base64.b64encode(obj).decode("ascii")
+    if hasattr(obj, "__array_interface__"):
+        # numpy arrays orjson cannot walk natively (non-contiguous, object
+        # dtype) and every array on the stdlib backend.
+        return obj.tolist()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # Only reached on the stdlib backend; orjson walks dataclasses itself.
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+
+    _OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj) -> bytes:
+        """Serialize ``obj`` to UTF-8 encoded JSON bytes."""
+        return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+    loads = orjson.loads
+
+else:
+
+    def dumps(obj) -> bytes:
+        """Serialize ``obj`` to UTF-8 encoded JSON bytes."""
+        return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+    loads = json.loads
+
+
+# JSON value types accepted for a field of each annotated type; bool is
+# excluded from int/float separately. Mirrors msgspec's strict decoding.
+_JSON_TYPES = {int: (int,), float: (int, float), str: (str,), bool: (bool,)}
+
+
+def _check_fields(cls: Any) -> Callable[[Dict[str, Any], str], None]:
+    """
+    Build a type check for ``cls`` fields in a decoded JSON object.
+
+    Used on the stdlib path so it rejects the same bodies msgspec does.
+    """
+    types = {
+        name: _JSON_TYPES[hint]
+        for name, hint in get_type_hints(cls).items()
+        if hint in _JSON_TYPES
+    }
+
+    def check(item: Dict[str, Any], where: str) -> None:
+        if not isinstance(item, dict):
+            raise ValidationError(
+                "response",
+                f"Expected `object`, got `{type(item).__name__}` - at `{where}`",
+            )
+        for name, expected in types.items():
+            if name not in item:
+                continue
+            value = item[name]
+            if not isinstance(value, expected) or (
+                isinstance(value, bool) and bool not in expected
+            ):
+                raise ValidationError(
+                    "response",
+                    f"Expected `{expected[-1].__name__}`, got "
+                    f"`{type(value).__name__}` - at `{where}.{name}`",
+                )
+
+    return check
+
+
+def list_decoder(
+    cls: Any, key: str
+) -> Callable[[Union[bytes, bytearray]], List[Any]]:
+    """
+    Build a decoder for ``{key: [cls, ...]}`` response bodies.
+
+    With msgspec installed the list is decoded straight into ``cls``
+    instances in C; otherwise it goes through ``loads`` and
+    ``cls.from_dict``. Both paths accept the same bodies and raise
+    ``ValidationError`` for malformed ones.
+    """
+    if msgspec is not None:
+        container = msgspec.defstruct(f"{cls.__name__}List", [(key, List[cls], [])])
+        decoder = msgspec.json.Decoder(container)
+
+        def decode_structs(raw: Union[bytes, bytearray]) -> List[Any]:
+            try:
+                items: List[Any] = getattr(decoder.decode(raw), key)
+            except msgspec.DecodeError as e:  # includes msgspec.ValidationError
+                raise ValidationError("response", str(e)) from e
+            return items
+
+        return decode_structs
+
+    from_dict = cls.from_dict
+    check = _check_fields(cls)
+
+    def decode_dicts(raw: Union[bytes, bytearray]) -> List[Any]:
+        try:
+            body = loads(raw)
+            check(body, "$")
+            items = body.get(key, [])
+            if not isinstance(items, list):
+                raise ValidationError(
+                    "response",
+                    f"Expected `array`, got `{type(items).__name__}` - at `$.{key}`",
+                )
+            for i, item in enumerate(items):
+                check(item, f"$.{key}[{i}]")
+            return list(map(from_dict, items))
+        except (KeyError, ValueError) as e:
+            raise ValidationError("response", repr(e)) from e
+
+    return decode_dicts
@@ -0,0 +1,476 @@
+"""
+AiMesh SDK HTTP transport
+
+Keep-alive connection pools: one built on http.client, and an optional
+HTTP/2 one built on httpx.
+"""
+
+import base64
+import gzip
+import http.client
+import io
+import socket
+import ssl
+import threading
+import urllib.request
+import zlib
+from contextlib import contextmanager
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Union,
+)
+from urllib.parse import SplitResult, unquote, urlsplit
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised without the extra
+    httpx = None  # type: ignore[assignment]
+
+try:
+    import brotli  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - exercised without brotli
+    brotli = None
+
+from .exceptions import AiMeshError, ConnectionError, TimeoutError
+
+
+# Content codings the pools can decode, for the Accept-Encoding header.
+ACCEPT_ENCODING = "gzip, br" if brotli is not None else "gzip"
+
+
+# Raised by the decompressors on a corrupt or truncated body.
+_DECOMPRESS_ERRORS = (zlib.error,) + ((brotli.error,) if brotli is not None else ())
+
+
+def _decompress(data: bytes, encoding: str) -> bytes:
+    try:
+        if encoding == "gzip":
+            return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+        if encoding == "br" and brotli is not None:
+            decoded: bytes = brotli.decompress(data)
+            return decoded
+    except _DECOMPRESS_ERRORS as e:
+        raise AiMeshError(f"Failed to decode {encoding} response body: {e}") from e
+    return data
+
+
+# Errors raised when the server has silently dropped an idle keep-alive
+# connection; the request never reached it and is safe to resend.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class HTTPPool(Protocol):
+    """Interface the clients use, implemented by both connection pools."""
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> ContextManager[Any]: ...
+
+    def read_body(self, response: Any) -> Union[bytes, bytearray]: ...
+
+    def stream_body(self, response: Any) -> io.BufferedIOBase: ...
+
+    def close(self) -> None: ...
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over an AF_UNIX socket; host/port only fill the Host header."""
+
+    def __init__(self, uds_path: str, host: str, port: Optional[int], timeout: float):
+        super().__init__(host, port, timeout=timeout)
+        self._uds_path = uds_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self._uds_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class _UnixHTTPSConnection(_UnixHTTPConnection):
+    """_UnixHTTPConnection with TLS on top, verified against ``host``."""
+
+    default_port = http.client.HTTPS_PORT
+
+    def __init__(self, uds_path: str, host: str, port: Optional[int], timeout: float):
+        super().__init__(uds_path, host, port, timeout)
+        self._ssl_context = ssl.create_default_context()
+
+    def connect(self) -> None:
+        super().connect()
+        self.sock = self._ssl_context.wrap_socket(self.sock, server_hostname=self.host)
+
+
+def _socket_address(uds_path: str) -> str:
+    """Translate a leading "@" to the Linux abstract socket namespace."""
+    if uds_path.startswith("@"):
+        return "\0" + uds_path[1:]
+    return uds_path
+
+
+def _environment_proxy(scheme: str, netloc: str) -> Optional[SplitResult]:
+    """
+    Proxy for a request to ``scheme://netloc``, as ``urlopen`` would pick it.
+
+    Reads ``<scheme>_proxy`` from the environment (or the platform
+    settings) and honours ``no_proxy``.
+    """
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(netloc):
+        return None
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+    return urlsplit(proxy)
+
+
+def _proxy_headers(proxy: SplitResult) -> Dict[str, str]:
+    """Proxy-Authorization for credentials embedded in the proxy URL."""
+    if proxy.username is None:
+        return {}
+    credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+    token = base64.b64encode(credentials.encode()).decode("ascii")
+    return {"Proxy-Authorization": f"Basic {token}"}
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of persistent HTTP/1.1 connections to one server.
+
+    Connections are checked out for the duration of a single request and
+    returned once the response body has been fully read, so consecutive
+    calls reuse the same TCP (and TLS) session instead of reconnecting.
+    With ``uds_path`` set, requests are carried over that Unix domain
+    socket instead of TCP, with TLS on top for https URLs.
+
+    Like ``urlopen``, the pool goes through the proxy named by
+    ``http_proxy``/``https_proxy`` unless ``no_proxy`` excludes the host;
+    https is tunnelled with CONNECT. Redirects are not followed.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float,
+        maxsize: int = 10,
+        uds_path: Optional[str] = None,
+    ):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {parts.scheme!r}")
+
+        self.base_url = base_url
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self._scheme = parts.scheme
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self._uds_path = _socket_address(uds_path) if uds_path else None
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+        # Plain HTTP goes to the proxy with absolute-form targets; https
+        # gets a CONNECT tunnel and keeps origin-form targets.
+        netloc = parts.netloc.rpartition("@")[2]
+        self._proxy = None if self._uds_path else _environment_proxy(parts.scheme, netloc)
+        self._proxy_headers = _proxy_headers(self._proxy) if self._proxy else {}
+        self._target_base = self._prefix
+        if self._proxy is not None and self._scheme == "http":
+            self._target_base = f"http://{netloc}{self._prefix}"
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self._uds_path:
+            # https keeps TLS over the socket, as httpx and aiohttp do.
+            uds_class = (
+                _UnixHTTPSConnection if self._scheme == "https" else _UnixHTTPConnection
+            )
+            return uds_class(self._uds_path, self._host, self._port, self.timeout)
+        if self._proxy is not None:
+            proxy_host = self._proxy.hostname or "localhost"
+            if self._scheme == "https":
+                conn = http.client.HTTPSConnection(
+                    proxy_host, self._proxy.port, timeout=self.timeout
+                )
+                conn.set_tunnel(self._host, self._port, headers=self._proxy_headers)
+                return conn
+            return http.client.HTTPConnection(
+                proxy_host, self._proxy.port, timeout=self.timeout
+            )
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(
+                self._host, self._port, timeout=self.timeout
+            )
+        return http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.maxsize:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    @contextmanager
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Iterator[http.client.HTTPResponse]:
+        """
+        Send a request and yield the response.
+
+        The connection goes back to the pool only if the caller consumed
+        the whole body; otherwise it is closed on exit.
+        """
+        target = self._target_base + path
+        headers = headers or {}
+        if self._proxy_headers and self._scheme == "http":
+            headers = {**headers, **self._proxy_headers}
+
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        reused = conn is not None
+        if conn is None:
+            conn = self._new_connection()
+
+        try:
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                response = conn.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                conn.close()
+                conn = self._new_connection()
+                conn.request(method, target, body=body, headers=headers)
+                response = conn.getresponse()
+
+            yield response
+        except socket.timeout:
+            conn.close()
+            raise TimeoutError(f"Request to {self.base_url}{path} timed out")
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise ConnectionError(f"Failed to connect to {self.base_url}{path}: {e}")
+        except BaseException:
+            conn.close()
+            raise
+        else:
+            if response.isclosed() and not response.will_close:
+                self._release(conn)
+            else:
+                conn.close()
+
+    def read_body(self, response: http.client.HTTPResponse) -> bytes:
+        """Read the whole body of a response, undoing any content coding."""
+        data = response.read()
+        encoding = response.getheader("Content-Encoding")
+        return _decompress(data, encoding) if encoding else data
+
+    def stream_body(self, response: http.client.HTTPResponse) -> io.BufferedIOBase:
+        """Binary stream over a response body, gunzipped on the fly if needed."""
+        if response.getheader("Content-Encoding") == "gzip":
+            return gzip.GzipFile(fileobj=response)
+        return response
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+def known_length(headers: Any) -> Optional[int]:
+    """Length of the decoded body, if the headers pin it down."""
+    if headers.get("Content-Encoding", "identity") != "identity":
+        return None
+    length = headers.get("Content-Length")
+    return int(length) if length and length.isdigit() else None
+
+
+class BodyBuffer:
+    """
+    Buffer preallocated to a response's announced length.
+
+    Streamed chunks are copied in place, which avoids holding both the
+    chunk list and the joined body in memory; a body that turns out
+    longer or shorter than announced is still returned whole.
+    """
+
+    def __init__(self, length: int):
+        self._buf = bytearray(length)
+        self._pos = 0
+
+    def write(self, chunk: bytes) -> None:
+        end = self._pos + len(chunk)
+        self._buf[self._pos:end] = chunk
+        self._pos = end
+
+    def getvalue(self) -> bytearray:
+        del self._buf[self._pos:]
+        return self._buf
+
+
+def fill_buffer(chunks: Iterable[bytes], length: int) -> bytearray:
+    """Copy streamed ``chunks`` into a ``BodyBuffer`` of ``length``."""
+    buf = BodyBuffer(length)
+    for chunk in chunks:
+        buf.write(chunk)
+    return buf.getvalue()
+
+
+class _HTTPXResponse(io.BufferedIOBase):
+    """
+    File-like view of a streamed httpx response.
+
+    Mirrors the parts of http.client.HTTPResponse the clients use:
+    ``status``, ``headers``, ``getheader()`` and buffered reads.
+    """
+
+    def __init__(self, response: "httpx.Response"):
+        self._response = response
+        self._chunks: Optional[Iterator[bytes]] = None
+        self._pending = b""
+        self.status = response.status_code
+        self.headers = response.headers
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        value: Optional[str] = self.headers.get(name, default)
+        return value
+
+    def readable(self) -> bool:
+        return True
+
+    def read_all(self) -> Union[bytes, bytearray]:
+        """
+        Read the whole body.
+
+        Unlike ``read()``, a body of known length is copied into one
+        preallocated buffer and returned as that ``bytearray``.
+        """
+        if self._chunks is None:
+            length = known_length(self.headers)
+            if length is not None:
+                self._chunks = iter(())
+                return fill_buffer(self._response.iter_bytes(), length)
+        return self.read()
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            if self._chunks is None:
+                self._chunks = iter(())
+                return self._response.read()
+            data = self._pending + b"".join(self._chunks)
+            self._pending = b""
+            return data
+        chunks = []
+        while size > 0:
+            chunk = self.read1(size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def read1(self, size: int = -1) -> bytes:
+        if self._chunks is None:
+            self._chunks = self._response.iter_bytes()
+        if not self._pending:
+            self._pending = next(self._chunks, b"")
+        if size is None or size < 0:
+            size = len(self._pending)
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+
+class HTTPXConnectionPool:
+    """
+    Connection pool backed by ``httpx.Client`` with HTTP/2 enabled.
+
+    Concurrent requests from several threads are multiplexed as streams
+    over a single connection when the server negotiates h2 via ALPN;
+    otherwise httpx falls back to HTTP/1.1 keep-alive.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float,
+        maxsize: int = 10,
+        uds_path: Optional[str] = None,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "HTTP/2 support requires httpx with the http2 extra; "
+                "install it with: pip install 'aimesh[http2]'"
+            )
+
+        self.base_url = base_url
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self._client = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=maxsize),
+                uds=_socket_address(uds_path) if uds_path else None,
+            ),
+            timeout=timeout,
+        )
+
+    @contextmanager
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Iterator[Any]:
+        """Send a request and yield a file-like response."""
+        url = f"{self.base_url}{path}"
+
+        try:
+            with self._client.stream(method, url, content=body, headers=headers) as response:
+                yield _HTTPXResponse(response)
+        except httpx.TimeoutException:
+            raise TimeoutError(f"Request to {url} timed out")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Failed to connect to {url}: {e}")
+
+    def read_body(self, response: _HTTPXResponse) -> Union[bytes, bytearray]:
+        """Read the whole body of a response; httpx has already decoded it."""
+        try:
+            return response.read_all()
+        except httpx.DecodingError as e:
+            encoding = response.getheader("Content-Encoding")
+            raise AiMeshError(
+                f"Failed to decode {encoding} response body: {e}"
+            ) from e
+
+    def stream_body(self, response: _HTTPXResponse) -> io.BufferedIOBase:
+        """Binary stream over a response body; httpx has already decoded it."""
+        return response
+
+    def close(self) -> None:
+        """Close the underlying httpx client."""
+        self._client.close()
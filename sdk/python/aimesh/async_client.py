@@ -0,0 +1,360 @@
+"""
+AiMesh Async Python Client
+
+asyncio client for interacting with AiMesh server. Requires aiohttp.
+"""
+
+import asyncio
+from typing import Callable, Dict, Iterable, List, Optional, Any, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised without the extra
+    aiohttp = None  # type: ignore[assignment]
+
+from . import _json
+from ._http import (
+    decode_endpoints,
+    error_from_response,
+    local_uds_path,
+    raw_messages,
+    retry_delay,
+)
+from ._transport import ACCEPT_ENCODING, BodyBuffer, _socket_address, known_length
+from .models import (
+    Message,
+    Acknowledgment,
+    EndpointMetrics,
+    BudgetInfo,
+)
+from .exceptions import (
+    ConnectionError,
+    TimeoutError,
+)
+
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+
+async def _read_body(response: "aiohttp.ClientResponse") -> Union[bytes, bytearray]:
+    """
+    Read a whole response body.
+
+    When the length is known up front the chunks are copied into one
+    preallocated buffer instead of being collected and joined.
+    """
+    length = known_length(response.headers)
+    if length is None:
+        return await response.read()
+
+    buf = BodyBuffer(length)
+    async for chunk in response.content.iter_any():
+        buf.write(chunk)
+    return buf.getvalue()
+
+
+class AsyncAiMeshClient:
+    """
+    AiMesh asyncio SDK Client.
+
+    All requests share one aiohttp session, so concurrent calls are
+    multiplexed over a bounded pool of keep-alive connections.
+
+    Example:
+        async with AsyncAiMeshClient("http://localhost:9000") as client:
+            messages = [Message(agent_id="my-agent", payload=p) for p in prompts]
+            acks = await client.send_many(messages, concurrency=16)
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:9000",
+        timeout: int = 30,
+        api_key: Optional[str] = None,
+        max_connections: int = 64,
+        max_retries: int = 5,
+        backoff_base: float = 0.1,
+        backoff_cap: float = 30.0,
+        uds_path: Optional[str] = None,
+    ):
+        """
+        Initialize async AiMesh client.
+
+        Args:
+            base_url: AiMesh server URL
+            timeout: Request timeout in seconds
+            api_key: Optional API key for authentication
+            max_connections: Maximum number of simultaneous connections
+            max_retries: Retries on 429 and 5xx responses (0 disables)
+            backoff_base: Base delay in seconds for exponential backoff
+            backoff_cap: Upper bound in seconds for a backoff delay; a longer
+                Retry-After raises instead of being waited out
+            uds_path: Unix socket of a local server (default: $AIMESH_UDS_PATH);
+                only used when ``base_url`` points at localhost
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncAiMeshClient requires aiohttp; "
+                "install it with: pip install 'aimesh[async]'"
+            )
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.api_key = api_key
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.uds_path = local_uds_path(self.base_url, uds_path)
+
+        # Session-wide headers; Content-Type is added per request, only when
+        # there is a JSON body, matching the sync client.
+        self._base_headers = {
+            "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
+        }
+        if api_key:
+            self._base_headers["Authorization"] = f"Bearer {api_key}"
+
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        # Created lazily so the session binds to the running event loop.
+        if self._session is None or self._session.closed:
+            connector: aiohttp.BaseConnector
+            if self.uds_path:
+                connector = aiohttp.UnixConnector(
+                    path=_socket_address(self.uds_path),
+                    limit=self.max_connections,
+                    keepalive_timeout=75,
+                )
+            else:
+                connector = aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    keepalive_timeout=75,
+                )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=self._base_headers,
+                read_bufsize=4 * 1024 * 1024,
+                # Pick up http_proxy/https_proxy/no_proxy like the sync client.
+                trust_env=True,
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncAiMeshClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Any] = None,
+        decode: Callable[[Union[bytes, bytearray]], Any] = _json.loads,
+    ) -> Any:
+        """
+        Make HTTP request to AiMesh server.
+
+        ``data`` may be a dict or a model dataclass; dataclasses are
+        serialized directly without an intermediate dict. Responses with
+        a retryable status are retried up to ``max_retries`` times with
+        jittered exponential backoff, honoring a Retry-After no longer than
+        ``backoff_cap``.
+
+        The response body is parsed with ``decode`` (plain JSON by default).
+        """
+        url = f"{self.base_url}{path}"
+
+        if data:
+            body = _json.dumps(data)
+            headers = _JSON_CONTENT_TYPE
+        else:
+            body = None
+            headers = None
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._get_session().request(
+                    method, url, data=body, headers=headers, allow_redirects=False
+                ) as response:
+                    raw = await _read_body(response)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Request to {url} timed out")
+            except aiohttp.ClientError as e:
+                raise ConnectionError(f"Failed to connect to {url}: {e}")
+
+            if response.status < 300:
+                return decode(raw)
+            delay = retry_delay(
+                response.status,
+                response.headers,
+                attempt,
+                self.max_retries,
+                self.backoff_base,
+                self.backoff_cap,
+            )
+            if delay is None:
+                raise error_from_response(response.status, response.headers, raw)
+            await asyncio.sleep(delay)
+
+    # Message Operations
+
+    async def send_message(self, message: Message) -> Acknowledgment:
+        """
+        Send a message for processing.
+
+        Args:
+            message: Message to send
+
+        Returns:
+            Acknowledgment with processing result
+        """
+        response = await self._request("POST", "/messages", message)
+        return Acknowledgment.from_dict(response)
+
+    async def send_batch(self, messages: List[Message]) -> List[Acknowledgment]:
+        """
+        Send multiple messages in a single batch request.
+
+        Args:
+            messages: List of messages to send
+
+        Returns:
+            List of acknowledgments
+        """
+        data = {"messages": messages}
+        response = await self._request("POST", "/messages/batch", data)
+        return [Acknowledgment.from_dict(ack) for ack in response.get("acknowledgments", [])]
+
+    async def send_batch_raw(
+        self,
+        agent_id: str,
+        payloads: Iterable[bytes],
+        priority: int = 50,
+        budget: float = 1000.0,
+    ) -> List[Acknowledgment]:
+        """
+        Send raw payloads from one agent as a batch, without building
+        a ``Message`` per payload.
+
+        Args:
+            agent_id: Agent identifier
+            payloads: Message payloads
+            priority: Message priority (0-100)
+            budget: Token budget per message
+
+        Returns:
+            List of acknowledgments
+        """
+        data = {"messages": raw_messages(agent_id, payloads, priority, budget)}
+        response = await self._request("POST", "/messages/batch", data)
+        return [Acknowledgment.from_dict(ack) for ack in response.get("acknowledgments", [])]
+
+    async def send_many(
+        self,
+        messages: List[Message],
+        concurrency: int = 32,
+    ) -> List[Acknowledgment]:
+        """
+        Send messages as concurrent individual requests.
+
+        Unlike ``send_batch``, each message is posted on its own, with at
+        most ``concurrency`` requests in flight at once. The first failure
+        is raised once every request has settled.
+
+        Args:
+            messages: List of messages to send
+            concurrency: Maximum number of in-flight requests
+
+        Returns:
+            List of acknowledgments, in the same order as ``messages``
+
+        Raises:
+            ValueError: If ``concurrency`` is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send_one(message: Message) -> Acknowledgment:
+            async with semaphore:
+                return await self.send_message(message)
+
+        results = await asyncio.gather(
+            *(send_one(m) for m in messages),
+            return_exceptions=True,
+        )
+        acks: List[Acknowledgment] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            acks.append(result)
+        return acks
+
+    # Endpoint Operations
+
+    async def register_endpoint(self, metrics: EndpointMetrics) -> bool:
+        """Register an AI endpoint."""
+        await self._request("POST", "/endpoints", metrics)
+        return True
+
+    async def list_endpoints(self) -> List[EndpointMetrics]:
+        """List all registered endpoints."""
+        endpoints: List[EndpointMetrics] = await self._request(
+            "GET", "/endpoints", decode=decode_endpoints
+        )
+        return endpoints
+
+    async def remove_endpoint(self, endpoint_id: str) -> bool:
+        """Remove an endpoint."""
+        await self._request("DELETE", f"/endpoints/{endpoint_id}")
+        return True
+
+    # Budget Operations
+
+    async def set_budget(
+        self,
+        agent_id: str,
+        tokens: float,
+        reset_at: Optional[int] = None,
+    ) -> bool:
+        """Set token budget for an agent."""
+        data = {
+            "agent_id": agent_id,
+            "tokens": tokens,
+            "reset_at": reset_at,
+        }
+        await self._request("POST", "/budgets", data)
+        return True
+
+    async def get_budget(self, agent_id: str) -> BudgetInfo:
+        """Get budget info for an agent."""
+        response = await self._request("GET", f"/budgets/{agent_id}")
+        return BudgetInfo.from_dict(response)
+
+    async def reset_budget(self, agent_id: str) -> bool:
+        """Reset an agent's budget to initial value."""
+        await self._request("POST", f"/budgets/{agent_id}/reset")
+        return True
+
+    # Stats Operations
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get system statistics."""
+        stats: Dict[str, Any] = await self._request("GET", "/stats")
+        return stats
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Check server health."""
+        health: Dict[str, Any] = await self._request("GET", "/health")
+        return health
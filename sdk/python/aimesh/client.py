@@ -4,12 +4,30 @@ AiMesh Python Client
 HTTP client for interacting with AiMesh server.
 """
 
-import json
+import io
 import time
-from typing import Dict, List, Optional, Any
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+    cast,
+)
 
+from . import _json
+from ._http import (
+    decode_endpoints,
+    error_from_response,
+    local_uds_path,
+    raw_messages,
+    retry_delay,
+)
+from ._transport import ACCEPT_ENCODING, ConnectionPool, HTTPPool, HTTPXConnectionPool
 from .models import (
     Message,
     RoutingDecision,
@@ -17,27 +35,22 @@ from .models import (
     EndpointMetrics,
     BudgetInfo,
 )
-from .exceptions import (
-    AiMeshError,
-    ConnectionError,
-    RateLimitError,
-    BudgetExceededError,
-    ValidationError,
-    TimeoutError,
-)
+from .exceptions import AiMeshError
 
 
 class AiMeshClient:
     """
     AiMesh Python SDK Client.
     
+    Connections are kept alive and reused across calls; use the client as
+    a context manager or call ``close()`` to release them.
+    
     Example:
-        client = AiMeshClient("http://localhost:9000")
-        
-        # Send a message
-        msg = Message(agent_id="my-agent", payload=b"Hello, AI!")
-        ack = client.send_message(msg)
-        print(f"Processed in {ack.processing_latency_ms}ms")
+        with AiMeshClient("http://localhost:9000") as client:
+            # Send a message
+            msg = Message(agent_id="my-agent", payload=b"Hello, AI!")
+            ack = client.send_message(msg)
+            print(f"Processed in {ack.processing_latency_ms}ms")
     """
     
     def __init__(
@@ -45,6 +58,12 @@ class AiMeshClient:
         base_url: str = "http://localhost:9000",
         timeout: int = 30,
         api_key: Optional[str] = None,
+        max_connections: int = 10,
+        max_retries: int = 5,
+        backoff_base: float = 0.1,
+        backoff_cap: float = 30.0,
+        http2: bool = False,
+        uds_path: Optional[str] = None,
     ):
         """
         Initialize AiMesh client.
@@ -53,52 +72,96 @@ class AiMeshClient:
             base_url: AiMesh server URL
             timeout: Request timeout in seconds
             api_key: Optional API key for authentication
+            max_connections: Maximum number of idle keep-alive connections
+            max_retries: Retries on 429 and 5xx responses (0 disables)
+            backoff_base: Base delay in seconds for exponential backoff
+            backoff_cap: Upper bound in seconds for a backoff delay; a longer
+                Retry-After raises instead of being waited out
+            http2: Multiplex requests over HTTP/2 (requires httpx[http2])
+            uds_path: Unix socket of a local server (default: $AIMESH_UDS_PATH);
+                only used when ``base_url`` points at localhost
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.api_key = api_key
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        
+        # Header sets are fixed per client: one for requests carrying a JSON
+        # body, and one without Content-Type for bodyless polls such as
+        # health_check and get_stats.
+        self._bodyless_headers = {
+            "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
+        }
+        if api_key:
+            self._bodyless_headers["Authorization"] = f"Bearer {api_key}"
+        self._base_headers = {
+            "Content-Type": "application/json",
+            **self._bodyless_headers,
+        }
+        
+        pool_class = HTTPXConnectionPool if http2 else ConnectionPool
+        self._pool: HTTPPool = pool_class(
+            self.base_url,
+            timeout,
+            maxsize=max_connections,
+            uds_path=local_uds_path(self.base_url, uds_path),
+        )
+    
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._pool.close()
+    
+    def __enter__(self) -> "AiMeshClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def _request(
         self,
         method: str,
         path: str,
-        data: Optional[dict] = None,
-    ) -> dict:
-        """Make HTTP request to AiMesh server."""
-        url = f"{self.base_url}{path}"
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-        
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
+        data: Optional[Any] = None,
+        decode: Callable[[Union[bytes, bytearray]], Any] = _json.loads,
+    ) -> Any:
+        """
+        Make HTTP request to AiMesh server.
         
-        body = json.dumps(data).encode() if data else None
+        ``data`` may be a dict or a model dataclass; dataclasses are
+        serialized directly without an intermediate dict. Responses with
+        a retryable status are retried up to ``max_retries`` times with
+        jittered exponential backoff, honoring a Retry-After no longer than
+        ``backoff_cap``.
         
-        req = Request(url, data=body, headers=headers, method=method)
+        The response body is parsed with ``decode`` (plain JSON by default).
+        """
+        if data:
+            body = _json.dumps(data)
+            headers = self._base_headers
+        else:
+            body = None
+            headers = self._bodyless_headers
         
-        try:
-            with urlopen(req, timeout=self.timeout) as response:
-                return json.loads(response.read().decode())
-        except HTTPError as e:
-            error_body = e.read().decode() if e.fp else ""
+        for attempt in range(self.max_retries + 1):
+            with self._pool.request(method, path, body, headers) as response:
+                raw = self._pool.read_body(response)
             
-            if e.code == 429:
-                retry_after = int(e.headers.get("Retry-After", 60))
-                raise RateLimitError(f"Rate limit exceeded: {error_body}", retry_after)
-            elif e.code == 402:
-                # Budget exceeded
-                raise BudgetExceededError("unknown", 0, 0)
-            elif e.code == 400:
-                raise ValidationError("request", error_body)
-            else:
-                raise AiMeshError(f"HTTP {e.code}: {error_body}")
-        except URLError as e:
-            raise ConnectionError(f"Failed to connect to {url}: {e.reason}")
-        except TimeoutError:
-            raise TimeoutError(f"Request to {url} timed out")
+            if response.status < 300:
+                return decode(raw)
+            delay = retry_delay(
+                response.status,
+                response.headers,
+                attempt,
+                self.max_retries,
+                self.backoff_base,
+                self.backoff_cap,
+            )
+            if delay is None:
+                raise error_from_response(response.status, response.headers, raw)
+            time.sleep(delay)
     
     # Message Operations
     
@@ -112,7 +175,7 @@ class AiMeshClient:
         Returns:
             Acknowledgment with processing result
         """
-        response = self._request("POST", "/messages", message.to_dict())
+        response = self._request("POST", "/messages", message)
         return Acknowledgment.from_dict(response)
     
     def send_batch(self, messages: List[Message]) -> List[Acknowledgment]:
@@ -125,7 +188,34 @@ class AiMeshClient:
         Returns:
             List of acknowledgments
         """
-        data = {"messages": [m.to_dict() for m in messages]}
+        data = {"messages": messages}
+        response = self._request("POST", "/messages/batch", data)
+        return [Acknowledgment.from_dict(ack) for ack in response.get("acknowledgments", [])]
+    
+    def send_batch_raw(
+        self,
+        agent_id: str,
+        payloads: Iterable[bytes],
+        priority: int = 50,
+        budget: float = 1000.0,
+    ) -> List[Acknowledgment]:
+        """
+        Send raw payloads from one agent as a batch.
+        
+        Skips building a ``Message`` per payload, which dominates the cost
+        of large batches; all messages share ``priority``, ``budget`` and
+        a single timestamp.
+        
+        Args:
+            agent_id: Agent identifier
+            payloads: Message payloads
+            priority: Message priority (0-100)
+            budget: Token budget per message
+            
+        Returns:
+            List of acknowledgments
+        """
+        data = {"messages": raw_messages(agent_id, payloads, priority, budget)}
         response = self._request("POST", "/messages/batch", data)
         return [Acknowledgment.from_dict(ack) for ack in response.get("acknowledgments", [])]
     
@@ -141,7 +231,7 @@ class AiMeshClient:
         Returns:
             True if successful
         """
-        self._request("POST", "/endpoints", metrics.to_dict())
+        self._request("POST", "/endpoints", metrics)
         return True
     
     def list_endpoints(self) -> List[EndpointMetrics]:
@@ -151,19 +241,10 @@ class AiMeshClient:
         Returns:
             List of endpoint metrics
         """
-        response = self._request("GET", "/endpoints")
-        return [
-            EndpointMetrics(
-                endpoint_id=e["endpoint_id"],
-                capacity=e["capacity"],
-                current_load=e["current_load"],
-                cost_per_1k_tokens=e["cost_per_1k_tokens"],
-                latency_p99_ms=e["latency_p99_ms"],
-                error_rate=e["error_rate"],
-                health_status=e.get("health_status", "healthy"),
-            )
-            for e in response.get("endpoints", [])
-        ]
+        endpoints: List[EndpointMetrics] = self._request(
+            "GET", "/endpoints", decode=decode_endpoints
+        )
+        return endpoints
     
     def remove_endpoint(self, endpoint_id: str) -> bool:
         """
@@ -249,12 +330,28 @@ class AiMeshClient:
         Returns:
             Prometheus-formatted metrics string
         """
-        url = f"{self.base_url}/metrics"
-        req = Request(url, method="GET")
+        return "".join(self.get_metrics_stream())
+    
+    def get_metrics_stream(self) -> Iterator[str]:
+        """
+        Stream Prometheus metrics line by line.
         
+        Lines are decoded as they arrive, so memory use stays bounded
+        regardless of the size of the exposition.
+        
+        Yields:
+            Prometheus-formatted lines, including trailing newlines
+        """
         try:
-            with urlopen(req, timeout=self.timeout) as response:
-                return response.read().decode()
+            with self._pool.request(
+                "GET", "/metrics", headers={"Accept-Encoding": "gzip"}
+            ) as response:
+                if response.status >= 300:
+                    raise AiMeshError(f"HTTP {response.status}")
+                body = self._pool.stream_body(response)
+                # typeshed wants a .name on the buffer, which BufferedIOBase
+                # does not declare; TextIOWrapper only reads it on request.
+                yield from io.TextIOWrapper(cast(BinaryIO, body), encoding="utf-8")
         except Exception as e:
             raise AiMeshError(f"Failed to get metrics: {e}")
     
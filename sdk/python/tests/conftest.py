@@ -0,0 +1,127 @@
+"""Shared fixtures: a local HTTP/1.1 server with scriptable responses."""
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import pytest
+
+
+Responder = Callable[["Handler"], None]
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "LocalServer"
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def send(
+        self,
+        status: int = 200,
+        body: Union[bytes, Dict[str, Any]] = b"{}",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        raw = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        self.body = json.loads(self.rfile.read(length)) if length else None
+        with self.server.lock:
+            self.server.requests.append(
+                (self.command, self.path, dict(self.headers), self.body)
+            )
+            responder = self.server.responses.pop(0) if self.server.responses else None
+        if responder is not None:
+            responder(self)
+        else:
+            self._default()
+
+    def _default(self) -> None:
+        if self.path == "/messages":
+            return self.send(body=_ack(self.body))
+        if self.path == "/messages/batch":
+            acks = [_ack(m) for m in self.body["messages"]]
+            return self.send(body={"acknowledgments": acks})
+        self.send(body={"status": "ok"})
+
+    do_GET = do_POST = do_DELETE = _handle
+
+
+def _ack(message: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "original_message_id": message["message_id"],
+        "status": "success",
+        "tokens_used": 1.0,
+        "processing_latency_ms": 1,
+    }
+
+
+class LocalServer(ThreadingHTTPServer):
+    """
+    Threaded server recording every request.
+
+    Responders queued on ``responses`` answer the next requests in order;
+    once it is empty, requests get a default JSON reply.
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests: List[Tuple[str, str, Dict[str, str], Any]] = []
+        self.responses: List[Responder] = []
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients that time out or drop the connection are expected here.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def reply(
+        self,
+        status: int = 200,
+        body: Union[bytes, Dict[str, Any]] = b"{}",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Queue a canned response."""
+        self.responses.append(lambda handler: handler.send(status, body, headers))
+
+
+@pytest.fixture
+def server():
+    srv = LocalServer()
+    thread = threading.Thread(target=srv.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _no_proxy_env(monkeypatch):
+    # Keep a proxy configured on the host from rerouting test traffic.
+    for name in ("http_proxy", "https_proxy", "no_proxy", "all_proxy"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
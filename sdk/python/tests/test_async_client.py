@@ -0,0 +1,100 @@
+"""Tests for AsyncAiMeshClient."""
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("aiohttp")
+
+from aimesh import (
+    AiMeshError,
+    AsyncAiMeshClient,
+    Message,
+    RateLimitError,
+    ValidationError,
+)
+
+
+@pytest_asyncio.fixture
+async def client(server):
+    async with AsyncAiMeshClient(server.url, backoff_base=0.001) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors(server, client):
+    server.reply(502)
+    server.reply(429, headers={"Retry-After": "0"})
+
+    assert await client.health_check() == {"status": "ok"}
+    assert len(server.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_raises_once_retries_are_used_up(server):
+    async with AsyncAiMeshClient(server.url, max_retries=1, backoff_base=0.001) as client:
+        server.reply(503, b"busy")
+        server.reply(503, b"busy")
+
+        with pytest.raises(AiMeshError, match="HTTP 503: busy"):
+            await client.health_check()
+    assert len(server.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_after_beyond_cap_raises_immediately(server, client):
+    server.reply(429, headers={"Retry-After": "3600"})
+
+    with pytest.raises(RateLimitError) as excinfo:
+        await client.health_check()
+    assert excinfo.value.retry_after == 3600
+    assert len(server.requests) == 1
+
+
+def _messages(*agent_ids):
+    return [Message(agent_id=agent_id, payload=b"x") for agent_id in agent_ids]
+
+
+@pytest.mark.asyncio
+async def test_send_many_keeps_message_order(server, client):
+    messages = _messages(*(f"agent-{i}" for i in range(20)))
+
+    acks = await client.send_many(messages, concurrency=4)
+
+    assert [a.original_message_id for a in acks] == [m.message_id for m in messages]
+
+
+@pytest.mark.asyncio
+async def test_send_many_raises_first_error_after_all_settle(server, client):
+    messages = _messages("a", "b", "c", "d")
+    server.reply(400, b"first")
+    server.reply(400, b"second")
+
+    with pytest.raises(ValidationError, match="first"):
+        await client.send_many(messages, concurrency=1)
+    assert len(server.requests) == len(messages)
+
+
+@pytest.mark.asyncio
+async def test_send_many_rejects_non_positive_concurrency(client):
+    with pytest.raises(ValueError):
+        await client.send_many(_messages("a"), concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_http_proxy_from_environment(server, monkeypatch):
+    monkeypatch.setenv("http_proxy", server.url)
+
+    async with AsyncAiMeshClient("http://aimesh.internal.example:9000") as client:
+        assert await client.health_check() == {"status": "ok"}
+
+    assert server.requests[0][1] == "http://aimesh.internal.example:9000/health"
+
+
+@pytest.mark.asyncio
+async def test_content_type_only_with_a_body(server, client):
+    await client.health_check()
+    await client.set_budget("a", 10)
+
+    get_headers, post_headers = server.requests[0][2], server.requests[1][2]
+    assert "Content-Type" not in get_headers
+    assert post_headers["Content-Type"] == "application/json"
@@ -0,0 +1,90 @@
+"""Tests for AiMeshClient request handling."""
+
+import gzip
+
+import pytest
+
+from aimesh import AiMeshClient, AiMeshError, RateLimitError, ValidationError
+
+
+@pytest.fixture
+def client(server):
+    with AiMeshClient(server.url, backoff_base=0.001) as client:
+        yield client
+
+
+def test_redirect_is_not_followed(server, client):
+    server.reply(302, b"", {"Location": "http://elsewhere.example/health"})
+
+    with pytest.raises(AiMeshError, match="302.*elsewhere.example"):
+        client.health_check()
+    assert len(server.requests) == 1
+
+
+def test_retries_transient_errors(server, client):
+    server.reply(503)
+    server.reply(429, headers={"Retry-After": "0"})
+
+    assert client.health_check() == {"status": "ok"}
+    assert len(server.requests) == 3
+
+
+def test_raises_once_retries_are_used_up(server):
+    with AiMeshClient(server.url, max_retries=2, backoff_base=0.001) as client:
+        for _ in range(3):
+            server.reply(500, b"boom")
+
+        with pytest.raises(AiMeshError, match="HTTP 500: boom"):
+            client.health_check()
+    assert len(server.requests) == 3
+
+
+def test_does_not_retry_client_errors(server, client):
+    server.reply(400, b"bad agent_id")
+
+    with pytest.raises(ValidationError):
+        client.health_check()
+    assert len(server.requests) == 1
+
+
+def test_retry_after_beyond_cap_raises_immediately(server, client):
+    server.reply(429, headers={"Retry-After": "3600"})
+
+    with pytest.raises(RateLimitError) as excinfo:
+        client.health_check()
+    assert excinfo.value.retry_after == 3600
+    assert len(server.requests) == 1
+
+
+@pytest.mark.parametrize("http2", [False, True])
+def test_compressed_body_is_decoded(server, http2):
+    if http2:
+        pytest.importorskip("h2")
+    body = gzip.compress(b'{"status": "ok"}')
+    server.reply(body=body, headers={"Content-Encoding": "gzip"})
+
+    with AiMeshClient(server.url, http2=http2) as client:
+        assert client.health_check() == {"status": "ok"}
+
+
+@pytest.mark.parametrize("http2", [False, True])
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_corrupt_compressed_body_raises_aimesh_error(server, http2, encoding):
+    if http2:
+        pytest.importorskip("h2")
+    if encoding == "br":
+        pytest.importorskip("brotli")
+    server.reply(body=b"not compressed", headers={"Content-Encoding": encoding})
+
+    with AiMeshClient(server.url, http2=http2) as client:
+        with pytest.raises(AiMeshError, match="decode"):
+            client.health_check()
+
+
+def test_content_type_only_with_a_body(server, client):
+    client.health_check()
+    client.set_budget("a", 10)
+
+    get_headers, post_headers = server.requests[0][2], server.requests[1][2]
+    assert "Content-Type" not in get_headers
+    assert post_headers["Content-Type"] == "application/json"
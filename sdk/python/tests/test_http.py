@@ -0,0 +1,61 @@
+"""Tests for the shared retry helpers."""
+
+import time
+from email.utils import formatdate
+
+import pytest
+
+from aimesh._http import backoff_delay, parse_retry_after, retry_delay
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("120", 120.0),
+        ("1.5", 1.5),
+        ("0", 0.0),
+        ("-5", 0.0),
+        (None, None),
+        ("", None),
+        ("soon", None),
+    ],
+)
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    value = formatdate(time.time() + 30, usegmt=True)
+
+    assert 28 <= parse_retry_after(value) <= 30
+
+
+def test_parse_retry_after_past_http_date_is_zero():
+    assert parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0.0
+
+
+def test_backoff_delay_is_bounded_by_exponential_and_cap():
+    for attempt in range(8):
+        delay = backoff_delay(attempt, base=0.1, cap=2.0)
+        assert 0 <= delay <= min(2.0, 0.1 * 2 ** attempt)
+
+
+def test_backoff_delay_never_undercuts_retry_after():
+    assert backoff_delay(0, base=0.1, cap=2.0, retry_after=1.5) >= 1.5
+
+
+def test_retry_delay_gives_up_on_non_retryable_status():
+    assert retry_delay(404, {}, 0, 5, 0.1, 30.0) is None
+
+
+def test_retry_delay_gives_up_after_max_retries():
+    assert retry_delay(503, {}, 4, 5, 0.1, 30.0) is not None
+    assert retry_delay(503, {}, 5, 5, 0.1, 30.0) is None
+
+
+def test_retry_delay_honours_retry_after():
+    assert retry_delay(429, {"Retry-After": "2"}, 0, 5, 0.1, 30.0) >= 2
+
+
+def test_retry_delay_gives_up_when_retry_after_exceeds_cap():
+    assert retry_delay(429, {"Retry-After": "3600"}, 0, 5, 0.1, 30.0) is None
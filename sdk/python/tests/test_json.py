@@ -0,0 +1,64 @@
+"""Tests for the JSON codec."""
+
+import json
+
+import pytest
+
+from aimesh import _json
+from aimesh.exceptions import ValidationError
+from aimesh.models import EndpointMetrics
+
+
+ENDPOINT = {
+    "endpoint_id": "e1",
+    "capacity": 10,
+    "current_load": 1,
+    "cost_per_1k_tokens": 1.5,
+    "latency_p99_ms": 20,
+    "error_rate": 0.0,
+}
+
+
+@pytest.fixture(params=["msgspec", "stdlib"])
+def decode(request, monkeypatch):
+    if request.param == "msgspec":
+        pytest.importorskip("msgspec")
+    else:
+        monkeypatch.setattr(_json, "msgspec", None)
+    return _json.list_decoder(EndpointMetrics, "endpoints")
+
+
+def _body(**overrides):
+    endpoint = {**ENDPOINT, **overrides}
+    endpoint = {k: v for k, v in endpoint.items() if v is not ...}
+    return json.dumps({"endpoints": [endpoint]}).encode()
+
+
+def test_decodes_endpoints(decode):
+    [endpoint] = decode(_body(extra="ignored"))
+
+    assert endpoint == EndpointMetrics(**ENDPOINT)
+    assert endpoint.health_status == "healthy"
+
+
+def test_missing_list_is_empty(decode):
+    assert decode(b"{}") == []
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        _body(capacity=...),
+        _body(capacity=1.5),
+        _body(capacity="5"),
+        _body(capacity=True),
+        _body(health_status=None),
+        b'{"endpoints": [1]}',
+        b'{"endpoints": {}}',
+        b"[1]",
+        b"not json",
+    ],
+)
+def test_malformed_bodies_raise_validation_error(decode, body):
+    with pytest.raises(ValidationError):
+        decode(body)
@@ -0,0 +1,67 @@
+"""Tests for the data models."""
+
+import json
+
+import pytest
+
+from aimesh import Message, _json
+
+
+def _wire(message):
+    return json.loads(_json.dumps(message))
+
+
+@pytest.mark.parametrize(
+    "payload, encoding",
+    [(b"\x00\xff", "base64"), (bytearray(b"ab"), "base64"), ("deadbeef", "hex")],
+)
+def test_payload_encoding_is_inferred(payload, encoding):
+    message = Message(agent_id="a", payload=payload)
+
+    assert message.payload_encoding == encoding
+    assert _wire(message)["payload_encoding"] == encoding
+    assert message.to_dict()["payload_encoding"] == encoding
+
+
+def test_str_payload_may_be_labelled_base64():
+    message = Message(agent_id="a", payload="3q2+7w==", payload_encoding="base64")
+
+    assert _wire(message)["payload"] == "3q2+7w=="
+    assert Message.from_dict(_wire(message)).payload == b"\xde\xad\xbe\xef"
+
+
+@pytest.mark.parametrize(
+    "payload, encoding",
+    [(b"ab", "hex"), (b"ab", "tensor"), ("deadbeef", "tensor"), ([1, 2], "base64")],
+)
+def test_contradicting_payload_encoding_is_rejected(payload, encoding):
+    with pytest.raises(ValueError):
+        Message(agent_id="a", payload=payload, payload_encoding=encoding)
+
+
+def test_bytes_payload_round_trips():
+    message = Message(agent_id="a", payload=b"\x00\xffhello")
+
+    decoded = Message.from_dict(_wire(message))
+
+    assert decoded.payload == message.payload
+    assert decoded.payload_encoding == "base64"
+
+
+def test_tensor_payload_round_trips():
+    np = pytest.importorskip("numpy")
+    message = Message(agent_id="a", payload=np.arange(3))
+
+    wire = _wire(message)
+    decoded = Message.from_dict(wire)
+
+    assert wire["payload"] == [0, 1, 2]
+    assert wire["payload_encoding"] == "tensor"
+    assert decoded.payload == [0, 1, 2]
+    assert _wire(decoded)["payload_encoding"] == "tensor"
+
+
+def test_legacy_hex_payload_is_decoded():
+    message = Message.from_dict({"agent_id": "a", "payload": "6869"})
+
+    assert message.payload == b"hi"